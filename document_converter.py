@@ -32,6 +32,10 @@ Advanced layout & processing:
  - Alignment inside content area (--align-h, --align-v)
  - Scaling modes: fit | fill | stretch | original
  - DPI control for mm→pixel/point conversions (--dpi)
+ - Batch pdf2doc / doc2pdf / remove_*_password over a directory or glob,
+   in parallel worker processes (--workers)
+ - Parallel page parsing for pdf2doc (--jobs)
+ - doc2pdf through one persistent Word instance on Windows (--fast-docx)
 
 USAGE (COMMAND SYNOPSIS)
 ------------------------
@@ -58,6 +62,9 @@ python document_converter.py "./scans" out.pdf images2pdf --streaming \
   --per-image-rotation "scan2.jpg:90" --per-page-sizes "scan1.jpg:210x297,scan2.jpg:297x210" \
   --autorotate --auto-orient --align-h center --align-v center --progress
 
+# 5) Batch: every PDF in a directory (or a quoted glob) -> DOCX files in ./out, 4 processes
+python document_converter.py ./reports ./out pdf2doc --workers 4
+
 MAPPING FORMATS (CSV or INLINE)
 -------------------------------
 Per-page sizes:  filename,210x297  or  filename:210x297
@@ -68,7 +75,7 @@ CSV files accept comments (#) and blank lines.
 INSTALL (recommended)
 ---------------------
 Recommended (all features):
-  pip install pillow reportlab PyPDF2 tqdm pikepdf pdf2docx docx2pdf msoffcrypto-tool
+  pip install pillow reportlab PyPDF2 tqdm pikepdf pdf2docx docx2pdf msoffcrypto-tool imagesize
 
 Minimal for streaming images->PDF:
   pip install pillow reportlab
@@ -76,6 +83,10 @@ Minimal for streaming images->PDF:
 Minimal for basic merging without streaming:
   pip install pillow PyPDF2
 
+Faster resizing in non-streaming mode (drop-in Pillow build with SIMD resize;
+x86 CPUs with SSE4, AVX2 for the full speedup; builds from source, needs a compiler):
+  pip uninstall pillow && pip install pillow-simd
+
 LICENSE (MIT) - include LICENSE file in project root
 ----------------------------------------------------
 MIT License
@@ -123,9 +134,25 @@ import sys
 import shutil
 import subprocess
 import argparse
+import gc
+import glob
 import io
+import mmap
+import pathlib
+import platform
+import re
+import socket
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from math import isfinite
-from PIL import Image, ExifTags
+from multiprocessing.util import Finalize
+from PIL import Image, ImageOps, __version__ as PIL_VERSION
 
 # Optional libraries
 try:
@@ -133,29 +160,81 @@ try:
 except Exception:
     PyPDF2 = None
 
-try:
-    import pikepdf
-except Exception:
-    pikepdf = None
+# The heavy document libraries (pikepdf/qpdf, pdf2docx/PyMuPDF, docx2pdf, pywin32, uno)
+# are imported on first use by the _load_* helpers below, so commands that don't need
+# them (--help, images2pdf, ...) skip their start-up cost. The names stay None until
+# loaded, and for good if the import fails.
+pikepdf = None
+Converter = None
+docx2pdf_convert = None
+win32_client = None         # Word automation (Windows, pywin32) for --fast-docx
+uno = None                  # LibreOffice Python bindings (ship with LibreOffice / python3-uno)
+NoConnectException = None
+
+@lru_cache(maxsize=None)
+def _load_pikepdf():
+    global pikepdf
+    try:
+        import pikepdf as module
+        pikepdf = module
+    except Exception:
+        pass
+    return pikepdf
 
-try:
-    from pdf2docx import Converter
-except Exception:
-    Converter = None
+@lru_cache(maxsize=None)
+def _load_pdf2docx():
+    global Converter
+    try:
+        from pdf2docx import Converter
+    except Exception:
+        pass
+    return Converter
 
-try:
-    from docx2pdf import convert as docx2pdf_convert
-except Exception:
-    docx2pdf_convert = None
+@lru_cache(maxsize=None)
+def _load_docx2pdf():
+    global docx2pdf_convert
+    try:
+        from docx2pdf import convert as docx2pdf_convert
+    except Exception:
+        pass
+    return docx2pdf_convert
+
+@lru_cache(maxsize=None)
+def _load_win32com():
+    global win32_client
+    try:
+        import win32com.client as win32_client
+    except Exception:
+        pass
+    return win32_client
+
+@lru_cache(maxsize=None)
+def _load_uno():
+    global uno, NoConnectException
+    try:
+        import uno
+        from com.sun.star.connection import NoConnectException
+    except Exception:
+        pass
+    return uno
 
 # streaming PDF library (reportlab)
 try:
+    from reportlab import rl_config
     from reportlab.pdfgen.canvas import Canvas
     from reportlab.lib.units import mm as RL_MM
     from reportlab.lib.utils import ImageReader
     REPORTLAB_AVAILABLE = True
 except Exception:
     REPORTLAB_AVAILABLE = False
+    rl_config = None
+    RL_MM = 72.0 / 25.4  # points per mm; layout math also runs without reportlab
+
+# header-only image dimensions
+try:
+    import imagesize
+except Exception:
+    imagesize = None
 
 # progress bar
 try:
@@ -171,6 +250,41 @@ PAGE_SIZES_MM = {
     "A5": (148.0, 210.0),
 }
 
+# write buffer for outputs produced in many small writes
+_OUTPUT_BUFFER = 1 << 20
+# read buffer for inputs consumed in many small reads; above _MMAP_MIN_SIZE such
+# inputs are memory-mapped instead so random seeks are served from the page cache
+_INPUT_BUFFER = 1 << 20
+_MMAP_MIN_SIZE = 64 << 20
+
+# image extensions picked up from directory inputs
+_IMG_EXTS = (".jpg", ".jpeg", ".png", ".tiff", ".bmp", ".webp")
+
+# mapping entries, matched in one regex pass over the whole input. CSV lines split
+# at the first ':' if the line has one, else at the first ',' (so "a.jpg,8,12,8,12"
+# keeps its four margins); '#' lines are comments. Inline pairs are "name:value".
+_CSV_MAPPING_RE = re.compile(r"^(?![ \t]*#)(?:([^:\n]*):|([^,:\n]*),)(.*)$", re.M)
+_INLINE_MAPPING_RE = re.compile(r"(?:^|,)([^,:]*):([^,]*)")
+
+# EXIF orientation tag id (values 1-8; 1 is upright)
+_ORIENTATION_TAG = 0x0112
+# orientations whose transform (rotate by 90/270, transpose, transverse) swaps width and height
+_EXIF_SWAPS_AXES = frozenset((5, 6, 7, 8))
+
+# Pillow >= 7 can shrink by an integer factor with Image.reduce() before the
+# LANCZOS pass (reducing_gap), so the expensive filter touches far fewer pixels.
+_RESIZE_KWARGS = {"reducing_gap": 3.0} if hasattr(Image.Image, "reduce") else {}
+
+# Image.Resampling exists from Pillow 9.1 (the bare Image.LANCZOS alias warns there)
+_LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+# Pillow-SIMD releases carry a ".postN" version suffix; its LANCZOS resize is several
+# times faster, so keep resizes on LANCZOS and RGB/L images to stay on its fast path.
+# It needs an x86 CPU with SSE4 (AVX2 for the full speedup), so only suggest it there.
+PILLOW_SIMD = ".post" in PIL_VERSION
+_SIMD_CAPABLE = platform.machine().lower() in ("x86_64", "amd64", "i386", "i686", "x86")
+_SIMD_HINT_SHOWN = False
+
 # -----------------------
 # Basic helpers
 # -----------------------
@@ -213,31 +327,13 @@ def parse_mapping(value, parse_value_func):
     value = str(value).strip()
     if os.path.exists(value) and os.path.isfile(value):
         with open(value, "r", encoding="utf-8") as f:
-            for ln in f:
-                ln = ln.strip()
-                if not ln or ln.startswith("#"):
-                    continue
-                # accept separators ':' or ','
-                if ":" in ln:
-                    fname, sval = ln.split(":", 1)
-                elif "," in ln:
-                    fname, sval = ln.split(",", 1)
-                else:
-                    continue
-                fname = os.path.basename(fname.strip())
-                try:
-                    mapping[fname] = parse_value_func(sval.strip())
-                except Exception:
-                    continue
-        return mapping
-    # inline mapping
-    for pair in [p.strip() for p in value.split(",") if p.strip()]:
-        if ":" in pair:
-            fname, sval = pair.split(":", 1)
-        elif "," in pair:
-            fname, sval = pair.split(",", 1)
-        else:
-            continue
+            text = f.read()
+        pairs = ((m.group(1) if m.group(1) is not None else m.group(2), m.group(3))
+                 for m in _CSV_MAPPING_RE.finditer(text))
+    else:
+        # inline mapping
+        pairs = (m.groups() for m in _INLINE_MAPPING_RE.finditer(value))
+    for fname, sval in pairs:
         fname = os.path.basename(fname.strip())
         try:
             mapping[fname] = parse_value_func(sval.strip())
@@ -282,25 +378,189 @@ def parse_rotation_value(s):
     except Exception:
         raise argparse.ArgumentTypeError("Invalid rotation value; must be integer degrees (0|90|180|270)")
 
-def autorotate_image_if_needed(img):
-    """Apply EXIF orientation; returns image (may be same object or rotated copy)."""
+def _exif_orientation(img):
+    """EXIF orientation (1-8) from the parsed header; 1 if absent or invalid. Does not decode pixels."""
     try:
-        exif = img._getexif()
-        if not exif:
-            return img
-        orientation_key = next((k for k, v in ExifTags.TAGS.items() if v == 'Orientation'), None)
-        if not orientation_key:
-            return img
-        orientation = exif.get(orientation_key, None)
-        if orientation == 3:
-            return img.rotate(180, expand=True)
-        if orientation == 6:
-            return img.rotate(270, expand=True)
-        if orientation == 8:
-            return img.rotate(90, expand=True)
+        orientation = img.getexif().get(_ORIENTATION_TAG, 1)
     except Exception:
-        pass
-    return img
+        return 1
+    return orientation if orientation in range(1, 9) else 1
+
+def autorotate_image_if_needed(img):
+    """Apply EXIF orientation (rotation and mirroring); returns image (same object or transposed copy)."""
+    if _exif_orientation(img) == 1:
+        # exif_transpose would return a copy, dropping the source format
+        return img
+    return ImageOps.exif_transpose(img)
+
+def scaled_size(img_w, img_h, content_w, content_h, scaling):
+    """
+    Target (w, h) for an img_w x img_h image in a content_w x content_h area, in the
+    caller's units (points or pixels). scaling: fit | fill | stretch | original.
+    """
+    if scaling == "original":
+        return img_w, img_h
+    if scaling == "stretch":
+        return content_w, content_h
+    ratio_img = img_w / img_h if img_h != 0 else 1.0
+    ratio_content = content_w / content_h if content_h != 0 else 1.0
+    # both are bounded by the tighter side of the content area: fill currently
+    # matches fit (baseline behavior)
+    if scaling == "fit":
+        width_bound = ratio_img > ratio_content
+    else:  # fill
+        width_bound = ratio_img >= ratio_content
+    if width_bound:
+        return content_w, content_w / ratio_img
+    return content_h * ratio_img, content_h
+
+def resize_image(img, size):
+    """LANCZOS resize to size (w, h); large downscales are pre-reduced when Pillow supports it."""
+    return img.resize(size, _LANCZOS, **_RESIZE_KWARGS)
+
+def collect_image_files(infiles, sort=False):
+    """
+    Resolve the image inputs: a directory yields its image files (sorted by name if
+    sort), anything else is a comma-separated list of paths that must exist.
+    """
+    files = []
+    if isinstance(infiles, str) and os.path.isdir(infiles):
+        # DirEntry.is_file() is answered from the directory read on most platforms,
+        # avoiding a stat() per entry
+        with os.scandir(infiles) as it:
+            entries = [e for e in it if e.name.lower().endswith(_IMG_EXTS) and e.is_file()]
+        if sort:
+            entries.sort(key=lambda e: e.name)
+        files = [e.path for e in entries]
+    else:
+        parts = [p.strip() for p in str(infiles).split(",") if p.strip()]
+        for p in parts:
+            if not os.path.exists(p):
+                raise FileNotFoundError(p)
+            files.append(p)
+
+    if not files:
+        raise RuntimeError("No images found to convert/merge.")
+    return files
+
+@dataclass
+class ImagePlan:
+    """Resolved per-image layout inputs: page (w, h) and margins (top, right, bottom, left)
+    in points and in pixels at dpi, plus the rotation override in degrees (0 = none)."""
+    __slots__ = ("page_pt", "page_px", "margins_pt", "margins_px", "rotation")
+    page_pt: tuple
+    page_px: tuple
+    margins_pt: tuple
+    margins_px: tuple
+    rotation: int
+
+def build_per_image_plan(files, per_page_sizes, per_image_margins, per_image_rotation,
+                         default_page_size_mm, default_margin_mm, dpi):
+    """
+    Resolve the per-image mappings for every file once, before the render loop.
+    Returns a list of ImagePlan indexed by file position, so the loop does no
+    per-basename dict lookups. Unit conversions are done once per distinct mm value
+    and files with identical settings share one plan object.
+    """
+    default_margins_mm = (default_margin_mm, default_margin_mm, default_margin_mm, default_margin_mm)
+    converted = {}
+    plans = {}
+
+    def convert(vals_mm):
+        key = tuple(vals_mm)
+        if key not in converted:
+            converted[key] = (tuple(mm_to_points(v) for v in key),
+                              tuple(mm_to_pixels(v, dpi) for v in key))
+        return converted[key]
+
+    result = []
+    for path in files:
+        basename = os.path.basename(path)
+        page_size_mm = per_page_sizes.get(basename, default_page_size_mm) if per_page_sizes else default_page_size_mm
+        margin_vals_mm = per_image_margins.get(basename, None) if per_image_margins else None
+        if not margin_vals_mm:
+            # uniform margin
+            margin_vals_mm = default_margins_mm
+        rotation = (per_image_rotation.get(basename, None) if per_image_rotation else None) or 0
+        key = (tuple(page_size_mm), tuple(margin_vals_mm), rotation)
+        if key not in plans:
+            page_pt, page_px = convert(page_size_mm)
+            margins_pt, margins_px = convert(margin_vals_mm)
+            plans[key] = ImagePlan(page_pt, page_px, margins_pt, margins_px, rotation)
+        result.append(plans[key])
+    return result
+
+def _prefetch_files(paths, window=32):
+    """
+    Yield paths unchanged while asking the kernel to read ahead the file `window`
+    positions further on (posix_fadvise WILLNEED), so disk reads overlap decoding.
+    No-op on platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        yield from paths
+        return
+
+    def advise(path):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    paths = list(paths)
+    for path in paths[:window]:
+        advise(path)
+    for i, path in enumerate(paths):
+        if i + window < len(paths):
+            advise(paths[i + window])
+        yield path
+
+def write_canvas(canvas, outfile):
+    """
+    Finish a reportlab canvas and write it to outfile. reportlab assembles the whole
+    document in memory, so its exact size is known: preallocate it (posix_fallocate,
+    where available) so large outputs are laid out in few extents, then write once.
+    """
+    data = canvas.getpdfdata()
+    with open(outfile, "wb") as fp:
+        if hasattr(os, "posix_fallocate") and data:
+            try:
+                os.posix_fallocate(fp.fileno(), 0, len(data))
+            except OSError:
+                pass  # e.g. filesystem without fallocate support
+        fp.write(data)
+
+@contextmanager
+def _binary_image_streams():
+    """
+    Keep reportlab from ASCII85-wrapping image and page streams (rl_config.useA85),
+    which inflates embedded JPEGs by a quarter. reportlab only has the global
+    switch, so it is flipped for the canvas's lifetime and then restored.
+    """
+    if rl_config is None:
+        yield
+        return
+    saved = rl_config.useA85
+    rl_config.useA85 = 0
+    try:
+        yield
+    finally:
+        rl_config.useA85 = saved
+
+def ordered_imap(executor, fn, *iterables, window=8):
+    """Like executor.map, but keeps at most `window` tasks in flight so results cannot pile up in memory."""
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
 
 def get_progress(iterable, total=None, show=True, desc=None):
     if not show:
@@ -308,16 +568,82 @@ def get_progress(iterable, total=None, show=True, desc=None):
     if tqdm:
         return tqdm(iterable, total=total, desc=desc)
     def gen():
+        # report at most once a second (and on the last item) so long runs
+        # to a pipe or CI log don't pay one write per item
         i = 0
+        next_t = time.monotonic()
         for item in iterable:
             i += 1
-            print(f"[{desc or 'Progress'}] {i}/{total or '?'}")
+            now = time.monotonic()
+            if now >= next_t or i == total:
+                sys.stdout.write(f"[{desc or 'Progress'}] {i}/{total or '?'}\n")
+                sys.stdout.flush()
+                next_t = now + 1.0
             yield item
     return gen()
 
 # -----------------------
 # Streaming implementation (reportlab)
 # -----------------------
+def _draw_source(pil_img, path):
+    """What to hand canvas.drawImage for an opened image."""
+    if pil_img.format == "JPEG":
+        # untouched JPEG (rotated copies carry no format): let reportlab embed the
+        # file's DCT stream as-is instead of decoding and re-encoding the pixels
+        return path
+    # Use ImageReader with PIL image object (in-memory) to avoid temp files
+    # Convert PIL to RGB if needed (reportlab drops alpha anyway; L stays gray)
+    if pil_img.mode not in ("RGB", "L"):
+        pil_img = pil_img.convert("RGB")
+    return ImageReader(pil_img)
+
+def _header_size(path):
+    """
+    Stored (width, height) parsed by imagesize from the first bytes of the file, without
+    setting up a PIL decoder; None if imagesize is missing or does not know the format.
+    """
+    if not imagesize:
+        return None
+    try:
+        w, h = imagesize.get(path, exif_rotation=False)
+    except TypeError:
+        w, h = imagesize.get(path)  # imagesize < 2 never applies EXIF rotation
+    return (w, h) if w > 0 and h > 0 else None
+
+def _streaming_fast(canvas, paths, page_size_mm, margin_mm, dpi):
+    """
+    Streaming loop for the default layout: one page size and uniform margin for all
+    images, fit scaling, centred, no rotation. Page geometry is fixed before the loop,
+    so each image costs a header read, the fit computation and the draw call.
+    """
+    page_w_pt, page_h_pt = mm_to_points(page_size_mm[0]), mm_to_points(page_size_mm[1])
+    margin_pt = mm_to_points(margin_mm)
+    content_w_pt = page_w_pt - 2 * margin_pt
+    content_h_pt = page_h_pt - 2 * margin_pt
+    if content_w_pt <= 0 or content_h_pt <= 0:
+        raise RuntimeError("Margins too large for page size")
+    px_to_pt = 72.0 / dpi
+
+    canvas.setPageSize((page_w_pt, page_h_pt))
+    for path in paths:
+        with ExitStack() as stack:
+            size = _header_size(path) if path.lower().endswith((".jpg", ".jpeg")) else None
+            if size:
+                # reportlab embeds the JPEG file itself; only its dimensions are needed here
+                source = path
+            else:
+                pil_img = stack.enter_context(Image.open(path))
+                size = pil_img.size
+                source = _draw_source(pil_img, path)
+            img_w_px, img_h_px = size
+            target_w_pt, target_h_pt = scaled_size(img_w_px * px_to_pt, img_h_px * px_to_pt,
+                                                   content_w_pt, content_h_pt, "fit")
+            x_pt = margin_pt + (content_w_pt - target_w_pt)/2.0
+            y_pt = margin_pt + (content_h_pt - target_h_pt)/2.0
+            canvas.drawImage(source, x_pt, y_pt, width=target_w_pt, height=target_h_pt, preserveAspectRatio=False, anchor='sw')
+            canvas.showPage()
+
+@_binary_image_streams()
 def streaming_images_to_pdf(infiles, outfile, default_page_size_mm=(210,297), dpi=300,
                             default_margin_mm=10, scaling="fit", show_progress=False, sort=False,
                             align_h="center", align_v="center", per_page_sizes=None,
@@ -333,63 +659,50 @@ def streaming_images_to_pdf(infiles, outfile, default_page_size_mm=(210,297), dp
     if not REPORTLAB_AVAILABLE:
         raise RuntimeError("reportlab is required for streaming mode: pip install reportlab")
 
-    # build list
-    files = []
-    if isinstance(infiles, str) and os.path.isdir(infiles):
-        entries = sorted(os.listdir(infiles)) if sort else os.listdir(infiles)
-        for fn in entries:
-            full = os.path.join(infiles, fn)
-            if os.path.isfile(full) and fn.lower().split(".")[-1] in ("jpg","jpeg","png","tiff","bmp","webp"):
-                files.append(full)
-    else:
-        parts = [p.strip() for p in str(infiles).split(",") if p.strip()]
-        for p in parts:
-            if not os.path.exists(p):
-                raise FileNotFoundError(p)
-            files.append(p)
-
-    if not files:
-        raise RuntimeError("No images found to convert/merge.")
+    files = collect_image_files(infiles, sort=sort)
 
     canvas = Canvas(outfile)
     total = len(files)
-    iterator = get_progress(files, total=total, show=show_progress, desc="Images")
+    trivial = (not per_page_sizes and not per_image_margins and not per_image_rotation
+               and not autorotate and not auto_orient and scaling == "fit"
+               and align_h == "center" and align_v == "center")
+    if trivial:
+        iterator = get_progress(_prefetch_files(files), total=total, show=show_progress, desc="Images")
+        _streaming_fast(canvas, iterator, default_page_size_mm, default_margin_mm, dpi)
+        write_canvas(canvas, outfile)
+        print(f"[✔] Streaming (constant memory) wrote {total} images -> {outfile}")
+        return
 
-    for path in iterator:
+    plans = build_per_image_plan(files, per_page_sizes, per_image_margins, per_image_rotation,
+                                 default_page_size_mm, default_margin_mm, dpi)
+    iterator = get_progress(_prefetch_files(files), total=total, show=show_progress, desc="Images")
+
+    for path, plan in zip(iterator, plans):
         basename = os.path.basename(path)
-        page_size_mm = per_page_sizes.get(basename, default_page_size_mm) if per_page_sizes else default_page_size_mm
-        margin_vals_mm = per_image_margins.get(basename, None) if per_image_margins else None
-        if not margin_vals_mm:
-            # uniform margin
-            margin_vals_mm = (default_margin_mm, default_margin_mm, default_margin_mm, default_margin_mm)
         # rotation override (applied to image pixels)
-        rotation_override = per_image_rotation.get(basename, None) if per_image_rotation else None
+        rotation_override = plan.rotation
 
-        # open image and apply autorotate / override rotation
+        # open image (header only); size as it will be after autorotate / override rotation
         with Image.open(path) as pil_img:
-            if autorotate:
-                pil_img = autorotate_image_if_needed(pil_img)
-            if rotation_override is not None:
-                if rotation_override != 0:
-                    pil_img = pil_img.rotate(-rotation_override, expand=True)  # negative because PIL rotates counter-clockwise
+            orientation = _exif_orientation(pil_img) if autorotate else 1
+            swap_axes = (orientation in _EXIF_SWAPS_AXES) != bool(rotation_override % 180)
             img_w_px, img_h_px = pil_img.size
+            if swap_axes:
+                img_w_px, img_h_px = img_h_px, img_w_px
 
             # auto-orient: if requested and rotating page makes fit better, swap page dimensions
-            page_w_mm, page_h_mm = page_size_mm
+            page_w_pt, page_h_pt = plan.page_pt
             if auto_orient:
                 img_ratio = img_w_px / img_h_px if img_h_px != 0 else 1.0
-                page_ratio = page_w_mm / page_h_mm if page_h_mm != 0 else 1.0
+                page_ratio = page_w_pt / page_h_pt if page_h_pt != 0 else 1.0
                 # if image and page aspect disagree, swap
                 if (img_ratio > 1 and page_ratio < 1) or (img_ratio < 1 and page_ratio > 1):
-                    page_w_mm, page_h_mm = page_h_mm, page_w_mm
-
-            page_w_pt = mm_to_points(page_w_mm)
-            page_h_pt = mm_to_points(page_h_mm)
+                    page_w_pt, page_h_pt = page_h_pt, page_w_pt
 
             # content area after per-side margins
-            top_mm, right_mm, bottom_mm, left_mm = margin_vals_mm
-            content_w_pt = page_w_pt - (mm_to_points(left_mm) + mm_to_points(right_mm))
-            content_h_pt = page_h_pt - (mm_to_points(top_mm) + mm_to_points(bottom_mm))
+            top_pt, right_pt, bottom_pt, left_pt = plan.margins_pt
+            content_w_pt = page_w_pt - (left_pt + right_pt)
+            content_h_pt = page_h_pt - (top_pt + bottom_pt)
             if content_w_pt <= 0 or content_h_pt <= 0:
                 raise RuntimeError(f"Margins too large for page size for {basename}")
 
@@ -398,178 +711,245 @@ def streaming_images_to_pdf(infiles, outfile, default_page_size_mm=(210,297), dp
             img_h_pt = (img_h_px / dpi) * 72.0
 
             # determine target size in points according to scaling
-            if scaling == "original":
-                target_w_pt, target_h_pt = img_w_pt, img_h_pt
-            elif scaling == "stretch":
-                target_w_pt, target_h_pt = content_w_pt, content_h_pt
-            else:
-                ratio_img = img_w_pt / img_h_pt if img_h_pt != 0 else 1.0
-                ratio_content = content_w_pt / content_h_pt if content_h_pt != 0 else 1.0
-                if (ratio_img > ratio_content and scaling == "fit") or (ratio_img < ratio_content and scaling == "fill"):
-                    if scaling == "fit":
-                        target_w_pt = content_w_pt
-                        target_h_pt = target_w_pt / ratio_img
-                    else:  # fill
-                        target_h_pt = content_h_pt
-                        target_w_pt = target_h_pt * ratio_img
-                else:
-                    if scaling == "fit":
-                        target_h_pt = content_h_pt
-                        target_w_pt = target_h_pt * ratio_img
-                    else:
-                        target_w_pt = content_w_pt
-                        target_h_pt = target_w_pt / ratio_img
+            target_w_pt, target_h_pt = scaled_size(img_w_pt, img_h_pt, content_w_pt, content_h_pt, scaling)
 
             # compute position according to alignment and margins
             if align_h == "left":
-                x_pt = mm_to_points(left_mm)
+                x_pt = left_pt
             elif align_h == "right":
-                x_pt = page_w_pt - mm_to_points(right_mm) - target_w_pt
+                x_pt = page_w_pt - right_pt - target_w_pt
             else:  # center
-                x_pt = mm_to_points(left_mm) + (content_w_pt - target_w_pt)/2.0
+                x_pt = left_pt + (content_w_pt - target_w_pt)/2.0
 
             if align_v == "top":
-                y_pt = page_h_pt - mm_to_points(top_mm) - target_h_pt
+                y_pt = page_h_pt - top_pt - target_h_pt
             elif align_v == "bottom":
-                y_pt = mm_to_points(bottom_mm)
+                y_pt = bottom_pt
             else:  # center
-                y_pt = mm_to_points(bottom_mm) + (content_h_pt - target_h_pt)/2.0
+                y_pt = bottom_pt + (content_h_pt - target_h_pt)/2.0
+
+            if (orientation != 1 or rotation_override) and scaling != "original" and pil_img.format == "JPEG":
+                # pixels must be decoded to rotate: decode at reduced scale, keeping at least
+                # 2x the pixels the drawn size needs at dpi
+                draft_w_pt, draft_h_pt = (target_h_pt, target_w_pt) if swap_axes else (target_w_pt, target_h_pt)
+                pil_img.draft("RGB", (max(1, int(draft_w_pt / 72.0 * dpi)) * 2,
+                                      max(1, int(draft_h_pt / 72.0 * dpi)) * 2))
+            if autorotate:
+                pil_img = autorotate_image_if_needed(pil_img)
+            if rotation_override:
+                pil_img = pil_img.rotate(-rotation_override, expand=True)  # negative because PIL rotates counter-clockwise
 
             # set page size and draw
             canvas.setPageSize((page_w_pt, page_h_pt))
-            # Use ImageReader with PIL image object (in-memory) to avoid temp files
-            # Convert PIL to RGB if needed
-            if pil_img.mode not in ("RGB", "RGBA"):
-                pil_img = pil_img.convert("RGB")
-            img_reader = ImageReader(pil_img)
-            canvas.drawImage(img_reader, x_pt, y_pt, width=target_w_pt, height=target_h_pt, preserveAspectRatio=False, anchor='sw')
+            canvas.drawImage(_draw_source(pil_img, path), x_pt, y_pt, width=target_w_pt, height=target_h_pt, preserveAspectRatio=False, anchor='sw')
             canvas.showPage()
 
-    canvas.save()
+    write_canvas(canvas, outfile)
     print(f"[✔] Streaming (constant memory) wrote {total} images -> {outfile}")
 
 # -----------------------
 # Non-streaming implementation (Pillow)
 # -----------------------
-def images_to_pdf_non_streaming(infiles, outfile, default_page_size_mm=(210,297), dpi=300,
-                                default_margin_mm=10, scaling="fit", show_progress=False, sort=False,
-                                align_h="center", align_v="center", per_page_sizes=None,
-                                per_image_margins=None, per_image_rotation=None, autorotate=False,
-                                auto_orient=False):
-    # build file list
-    files = []
-    if isinstance(infiles, str) and os.path.isdir(infiles):
-        entries = sorted(os.listdir(infiles)) if sort else os.listdir(infiles)
-        for fn in entries:
-            full = os.path.join(infiles, fn)
-            if os.path.isfile(full) and fn.lower().split(".")[-1] in ("jpg","jpeg","png","tiff","bmp","webp"):
-                files.append(full)
-    else:
-        parts = [p.strip() for p in str(infiles).split(",") if p.strip()]
-        for p in parts:
-            if not os.path.exists(p):
-                raise FileNotFoundError(p)
-            files.append(p)
+@_binary_image_streams()
+def write_pages_pdf(pages, outfile, dpi):
+    """
+    Write rendered pages to outfile as they arrive; returns the page count.
+    With reportlab, pages are (jpeg_bytes, (w, h)) pairs from _encode_one_page and
+    the JPEG data is embedded as-is, so no page raster reaches this process.
+    Without reportlab, pages are images and Pillow's single save_all call holds every page.
+    """
+    if not REPORTLAB_AVAILABLE:
+        # pages may share one reused buffer (see _PageBuffer); keep copies
+        images_pages = [page.copy() for page in pages]
+        first, rest = images_pages[0], images_pages[1:]
+        # Pillow writes the PDF in many small pieces; coalesce them
+        with open(outfile, "wb", buffering=_OUTPUT_BUFFER) as fp:
+            first.save(fp, "PDF", resolution=dpi, save_all=True, append_images=rest)
+        for im in images_pages:
+            try: im.close()
+            except Exception: pass
+        return len(images_pages)
 
-    if not files:
-        raise RuntimeError("No images found to convert/merge.")
+    canvas = Canvas(outfile)
+    count = 0
+    for jpeg, (w_px, h_px) in pages:
+        page_w_pt = w_px * 72.0 / dpi
+        page_h_pt = h_px * 72.0 / dpi
+        canvas.setPageSize((page_w_pt, page_h_pt))
+        canvas.drawImage(ImageReader(io.BytesIO(jpeg)), 0, 0, width=page_w_pt, height=page_h_pt)
+        canvas.showPage()
+        count += 1
+    write_canvas(canvas, outfile)
+    return count
+
+class _PageBuffer:
+    """
+    White RGB page reused (wiped) while consecutive pages share dimensions, so a page
+    must be consumed before the next is rendered. Owned by one render loop, so the
+    raster goes away with it and concurrent callers never share a page.
+    """
+    def __init__(self):
+        self.image = None
 
-    images_pages = []
-    iterator = get_progress(files, total=len(files), show=show_progress, desc="Images")
+    def blank(self, size):
+        if self.image is None or self.image.size != size:
+            self.image = Image.new("RGB", size, (255,255,255))
+        else:
+            self.image.paste((255,255,255), (0, 0) + size)
+        return self.image
 
-    for path in iterator:
-        basename = os.path.basename(path)
-        page_size_mm = per_page_sizes.get(basename, default_page_size_mm) if per_page_sizes else default_page_size_mm
-        margin_vals_mm = per_image_margins.get(basename, None) if per_image_margins else None
-        if not margin_vals_mm:
-            margin_vals_mm = (default_margin_mm, default_margin_mm, default_margin_mm, default_margin_mm)
-        rotation_override = per_image_rotation.get(basename, None) if per_image_rotation else None
+_worker_page_buffer = None  # one per render pool worker, set by _init_render_worker
 
-        # possibly auto-swap page orientation later; first open image
-        with Image.open(path) as im:
-            if autorotate:
-                im = autorotate_image_if_needed(im)
-            if rotation_override is not None and rotation_override != 0:
-                im = im.rotate(-rotation_override, expand=True)
-            img_w_px, img_h_px = im.size
+def _init_render_worker():
+    global _worker_page_buffer
+    _worker_page_buffer = _PageBuffer()
 
-            page_w_mm, page_h_mm = page_size_mm
-            if auto_orient:
-                img_ratio = img_w_px / img_h_px if img_h_px != 0 else 1.0
-                page_ratio = page_w_mm / page_h_mm if page_h_mm != 0 else 1.0
-                if (img_ratio > 1 and page_ratio < 1) or (img_ratio < 1 and page_ratio > 1):
-                    page_w_mm, page_h_mm = page_h_mm, page_w_mm
-
-            pw_px = mm_to_pixels(page_w_mm, dpi)
-            ph_px = mm_to_pixels(page_h_mm, dpi)
-            top_mm, right_mm, bottom_mm, left_mm = margin_vals_mm
-            top_px = mm_to_pixels(top_mm, dpi)
-            right_px = mm_to_pixels(right_mm, dpi)
-            bottom_px = mm_to_pixels(bottom_mm, dpi)
-            left_px = mm_to_pixels(left_mm, dpi)
-            content_w = max(1, pw_px - (left_px + right_px))
-            content_h = max(1, ph_px - (top_px + bottom_px))
-
-            # scaling logic
-            img_w, img_h = im.size
-            if scaling == "original":
-                target_w, target_h = img_w, img_h
-            elif scaling == "stretch":
-                target_w, target_h = content_w, content_h
-            else:
-                ratio_img = img_w / img_h if img_h != 0 else 1.0
-                ratio_content = content_w / content_h if content_h != 0 else 1.0
-                if (ratio_img > ratio_content and scaling == "fit") or (ratio_img < ratio_content and scaling == "fill"):
-                    if scaling == "fit":
-                        target_w = content_w
-                        target_h = int(round(target_w / ratio_img))
-                    else:
-                        target_h = content_h
-                        target_w = int(round(target_h * ratio_img))
-                else:
-                    if scaling == "fit":
-                        target_h = content_h
-                        target_w = int(round(target_h * ratio_img))
-                    else:
-                        target_w = content_w
-                        target_h = int(round(target_w / ratio_img))
-
-            # resize if needed
-            if scaling != "original":
-                resized = im.resize((max(1, int(target_w)), max(1, int(target_h))), Image.LANCZOS)
-            else:
-                resized = im
+@dataclass(frozen=True)
+class _PageParams:
+    """Job-wide render settings; plain values only so it pickles cheaply to worker processes."""
+    scaling: str
+    align_h: str
+    align_v: str
+    autorotate: bool
+    auto_orient: bool
 
-            # create page and paste according to alignment + margins
-            page = Image.new("RGB", (pw_px, ph_px), (255,255,255))
-            if align_h == "left":
-                x = left_px
-            elif align_h == "right":
-                x = pw_px - right_px - resized.width
-            else:
-                x = left_px + (content_w - resized.width)//2
+def _render_one_page(path, plan, params, page_buffer=None):
+    """
+    Decode, rotate, scale and place one image on a white page; returns the page image.
+    The page comes from page_buffer (or the pool worker's own) when given, else it is new.
+    """
+    page_buffer = page_buffer or _worker_page_buffer
+    # possibly auto-swap page orientation later; first open image (header only, no decode yet)
+    with Image.open(path) as im:
+        # size after autorotate / override rotation, so the layout can be decided before decoding
+        orientation = _exif_orientation(im) if params.autorotate else 1
+        swap_axes = (orientation in _EXIF_SWAPS_AXES) != bool(plan.rotation % 180)
+        img_w_px, img_h_px = im.size
+        if swap_axes:
+            img_w_px, img_h_px = img_h_px, img_w_px
+
+        pw_px, ph_px = plan.page_px
+        if params.auto_orient:
+            img_ratio = img_w_px / img_h_px if img_h_px != 0 else 1.0
+            page_w_pt, page_h_pt = plan.page_pt
+            page_ratio = page_w_pt / page_h_pt if page_h_pt != 0 else 1.0
+            if (img_ratio > 1 and page_ratio < 1) or (img_ratio < 1 and page_ratio > 1):
+                pw_px, ph_px = ph_px, pw_px
+
+        top_px, right_px, bottom_px, left_px = plan.margins_px
+        content_w = max(1, pw_px - (left_px + right_px))
+        content_h = max(1, ph_px - (top_px + bottom_px))
+
+        # scaling logic
+        target_w, target_h = scaled_size(img_w_px, img_h_px, content_w, content_h, params.scaling)
+        target_w, target_h = int(round(target_w)), int(round(target_h))
+
+        if params.scaling != "original" and im.format == "JPEG":
+            # let libjpeg decode at 1/2..1/8 scale, keeping at least 2x the target for LANCZOS
+            draft_w, draft_h = (target_h, target_w) if swap_axes else (target_w, target_h)
+            im.draft("RGB", (max(1, int(draft_w)) * 2, max(1, int(draft_h)) * 2))
+        # decode now, while the file is open, rather than lazily inside the first transform
+        im.load()
+        if params.autorotate:
+            im = autorotate_image_if_needed(im)
+        if plan.rotation:
+            im = im.rotate(-plan.rotation, expand=True)
+        # single mode decision: RGB and L paste onto the RGB page as they are
+        if im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+
+        # resize if needed
+        if params.scaling != "original":
+            resized = resize_image(im, (max(1, int(target_w)), max(1, int(target_h))))
+        else:
+            resized = im
 
-            if align_v == "top":
-                y = top_px + (content_h - resized.height)
-            elif align_v == "bottom":
-                y = bottom_px
-            else:
-                y = bottom_px + (content_h - resized.height)//2
+        # create page and paste according to alignment + margins
+        if page_buffer is not None:
+            page = page_buffer.blank((pw_px, ph_px))
+        else:
+            page = Image.new("RGB", (pw_px, ph_px), (255,255,255))
+        if params.align_h == "left":
+            x = left_px
+        elif params.align_h == "right":
+            x = pw_px - right_px - resized.width
+        else:
+            x = left_px + (content_w - resized.width)//2
 
-            page.paste(resized.convert("RGB"), (int(x), int(y)))
-            images_pages.append(page.copy())
+        if params.align_v == "top":
+            y = top_px + (content_h - resized.height)
+        elif params.align_v == "bottom":
+            y = bottom_px
+        else:
+            y = bottom_px + (content_h - resized.height)//2
+
+        page.paste(resized, (int(x), int(y)))
+        # free the decoded and resized rasters before the page is handed on, so at most
+        # the page itself stays alive between iterations
+        if resized is not im:
+            resized.close()
+        im.close()
+        del resized, im
+    return page
+
+def _encode_one_page(path, plan, params, page_buffer=None):
+    """
+    Render one page and JPEG-encode it (as Pillow's PDF writer does) where it was
+    rendered; returns (jpeg_bytes, (w, h)). A pool worker then sends back the
+    compressed page instead of pickling the whole raster.
+    """
+    page = _render_one_page(path, plan, params, page_buffer)
+    buf = io.BytesIO()
+    page.save(buf, "JPEG")
+    return buf.getvalue(), page.size
 
-    # save pages as PDF
-    first, rest = images_pages[0], images_pages[1:]
-    first.save(outfile, "PDF", resolution=dpi, save_all=True, append_images=rest)
-    for im in images_pages:
-        try: im.close()
-        except Exception: pass
-    print(f"[✔] Merged {len(images_pages)} images -> {outfile} (non-streaming)")
+def images_to_pdf_non_streaming(infiles, outfile, default_page_size_mm=(210,297), dpi=300,
+                                default_margin_mm=10, scaling="fit", show_progress=False, sort=False,
+                                align_h="center", align_v="center", per_page_sizes=None,
+                                per_image_margins=None, per_image_rotation=None, autorotate=False,
+                                auto_orient=False, workers=None):
+    """
+    Pillow-based writer. Pages are rendered in parallel across `workers` processes
+    (default: one per CPU; 1 renders in-process).
+    """
+    global _SIMD_HINT_SHOWN
+    files = collect_image_files(infiles, sort=sort)
+    if scaling != "original" and not PILLOW_SIMD and _SIMD_CAPABLE and not _SIMD_HINT_SHOWN:
+        # a hint, not output: stderr and once per process, so scripted/batch runs stay clean
+        _SIMD_HINT_SHOWN = True
+        print("[ℹ] Resizing with stock Pillow; pillow-simd makes it several times faster: "
+              "pip uninstall pillow && pip install pillow-simd", file=sys.stderr)
+
+    plans = build_per_image_plan(files, per_page_sizes, per_image_margins, per_image_rotation,
+                                 default_page_size_mm, default_margin_mm, dpi)
+    params = repeat(_PageParams(scaling=scaling, align_h=align_h, align_v=align_v,
+                                autorotate=autorotate, auto_orient=auto_orient))
+
+    # pages are independent, so decode/resize (and JPEG encoding, with reportlab) runs in
+    # worker processes; results come back in input order and are written as they arrive
+    render = _encode_one_page if REPORTLAB_AVAILABLE else _render_one_page
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as executor:
+            pages = ordered_imap(executor, render, _prefetch_files(files), plans, params, window=2 * workers)
+            count = write_pages_pdf(get_progress(pages, total=len(files), show=show_progress, desc="Images"),
+                                    outfile, dpi)
+    else:
+        # the reused page lives only as long as this call
+        pages = map(render, _prefetch_files(files), plans, params, repeat(_PageBuffer()))
+        count = write_pages_pdf(get_progress(pages, total=len(files), show=show_progress, desc="Images"),
+                                outfile, dpi)
+    print(f"[✔] Merged {count} images -> {outfile} (non-streaming)")
 
 # -----------------------
 # Other helpers (pdf merge, pdf->docx, docx->pdf)
 # -----------------------
+def _open_pdf(path, **kwargs):
+    """pikepdf.open with the file memory-mapped on POSIX instead of read into memory."""
+    if os.name == "posix":
+        kwargs.setdefault("access_mode", pikepdf.AccessMode.mmap)
+    return pikepdf.open(path, **kwargs)
+
 def pdf_merge(infiles, outfile):
     files = [p.strip() for p in str(infiles).split(",") if p.strip()]
     if not files:
@@ -578,6 +958,28 @@ def pdf_merge(infiles, outfile):
         if not os.path.exists(p):
             raise FileNotFoundError(p)
 
+    # pikepdf (qpdf) copies page objects by reference and only rewrites the xref;
+    # PyPDF2 re-parses and re-emits every object, so it is kept as the fallback
+    if _load_pikepdf():
+        try:
+            with ExitStack() as stack:
+                merged = stack.enter_context(pikepdf.Pdf.new())
+                for p in files:
+                    # sources must stay open until save: copied pages still reference them
+                    src = stack.enter_context(_open_pdf(p))
+                    merged.pages.extend(src.pages)
+                out = stack.enter_context(open(outfile, "wb", buffering=_OUTPUT_BUFFER))
+                # content streams are copied as stored, never decoded and re-compressed
+                merged.save(out, object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                            stream_decode_level=pikepdf.StreamDecodeLevel.none)
+            print(f"[✔] Merged {len(files)} PDFs -> {outfile} (pikepdf)")
+            return
+        except (pikepdf.PdfError, pikepdf.PasswordError) as e:
+            # encrypted or damaged input; PyPDF2 is more lenient with some of these
+            if not PyPDF2:
+                raise
+            print(f"[ℹ] pikepdf could not merge ({e}); retrying with PyPDF2")
+
     if PyPDF2:
         merger = PyPDF2.PdfMerger()
         try:
@@ -593,48 +995,418 @@ def pdf_merge(infiles, outfile):
                 pass
         return
 
-    if pikepdf:
-        merged = pikepdf.Pdf.new()
-        for p in files:
-            src = pikepdf.Pdf.open(p)
-            merged.pages.extend(src.pages)
-        merged.save(outfile)
-        print(f"[✔] Merged {len(files)} PDFs -> {outfile} (pikepdf)")
-        return
-
     raise RuntimeError("Install PyPDF2 or pikepdf to enable pdf merging: `pip install PyPDF2 pikepdf`")
 
-def pdf_to_docx(infile, outfile):
-    if not Converter:
+def pdf_to_docx(infile, outfile, jobs=None):
+    """jobs: processes parsing pages in parallel (default: CPUs - 1; 1 parses in-process)."""
+    if not _load_pdf2docx():
         raise RuntimeError("Missing library: install with `pip install pdf2docx`")
-    cv = Converter(infile)
-    cv.convert(outfile, start=0, end=None)
-    cv.close()
+    jobs = jobs or max(1, (os.cpu_count() or 1) - 1)
+    # read the PDF in one pass and let PyMuPDF parse it from memory, rather than
+    # leaving the file access pattern to it (slow on network shares); the file name
+    # stays set for pdf2docx's messages and its multi-processing workers
+    with open(infile, "rb") as f:
+        data = f.read()
+    try:
+        cv = Converter(infile, stream=data)
+    except TypeError:
+        # pdf2docx without stream support
+        cv = Converter(infile)
+    try:
+        if jobs > 1:
+            cv.convert(outfile, start=0, end=None, multi_processing=True, cpu_count=jobs)
+        else:
+            cv.convert(outfile, start=0, end=None)
+    finally:
+        cv.close()
     print(f"[✔] Converted PDF -> DOCX: {outfile}")
 
-def docx_to_pdf(infile, outfile):
-    if docx2pdf_convert:
+class _SofficeListener:
+    """
+    One headless LibreOffice started on first use and driven over UNO, so each
+    conversion skips soffice's multi-second startup. It runs with its own profile
+    dir (so it never hands off to a user's running instance) and is shut down at exit.
+    """
+    def __init__(self, soffice, timeout=30.0):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        self.pid = os.getpid()
+        self.proc = subprocess.Popen(
+            [soffice, "--headless", "--invisible", "--nologo", "--norestore",
+             "-env:UserInstallation=" + uno.systemPathToFileUrl(_lo_profile_dir()),
+             f"--accept=socket,host=127.0.0.1,port={port};urp;"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # multiprocessing finalizers run at interpreter exit and also when a pool
+        # worker process exits (atexit handlers do not run there)
+        Finalize(self, self.close, exitpriority=10)
+
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx)
+        url = f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                ctx = resolver.resolve(url)
+                break
+            except NoConnectException:
+                if self.proc.poll() is not None or time.monotonic() > deadline:
+                    self.close()
+                    raise RuntimeError("LibreOffice listener did not start")
+                time.sleep(0.25)
+        self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+
+    def convert(self, infile, outfile, filter_name="writer_pdf_Export"):
+        doc = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(infile)), "_blank", 0, _uno_props(Hidden=True))
+        try:
+            doc.storeToURL(uno.systemPathToFileUrl(os.path.abspath(outfile)),
+                           _uno_props(FilterName=filter_name))
+        finally:
+            doc.close(True)
+
+    def close(self):
+        if os.getpid() != self.pid:
+            return  # inherited through fork; the instance belongs to the parent
+        if self.proc.poll() is None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+_SOFFICE_LISTENER = None
+_SOFFICE_LISTENER_FAILED = False  # set after a failed start so each document doesn't wait out the timeout again
+
+def _soffice_listener(soffice):
+    """This process's running listener, (re)started on demand; None if it cannot be started."""
+    global _SOFFICE_LISTENER, _SOFFICE_LISTENER_FAILED
+    listener = _SOFFICE_LISTENER
+    if listener is not None and (listener.pid != os.getpid() or listener.proc.poll() is not None):
+        listener = _SOFFICE_LISTENER = None  # crashed, or inherited from the parent through fork
+    if listener is None and not _SOFFICE_LISTENER_FAILED:
+        try:
+            listener = _SOFFICE_LISTENER = _SofficeListener(soffice)
+        except Exception as e:
+            _SOFFICE_LISTENER_FAILED = True
+            print(f"[ℹ] LibreOffice listener unavailable ({e}); using soffice --convert-to")
+    return listener
+
+def _lo_profile_dir():
+    """Private LibreOffice profile dir for this process, so parallel soffice runs never share one."""
+    return _lo_profile_for_pid(os.getpid())
+
+@lru_cache(maxsize=None)
+def _lo_profile_for_pid(pid):
+    # keyed by pid: a forked worker must not reuse the parent's cached dir
+    path = tempfile.mkdtemp(prefix=f"lo-profile-{pid}-")
+    # removed at exit, after the listener (higher exitpriority) has shut down
+    Finalize(None, shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, exitpriority=0)
+    return path
+
+def _uno_props(**values):
+    """Tuple of com.sun.star.beans.PropertyValue for UNO calls."""
+    props = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name, prop.Value = name, value
+        props.append(prop)
+    return tuple(props)
+
+_WORD_APP = None
+_WORD_APP_FAILED = False  # set after Word failed to start; the regular path is used from then on
+_WD_FORMAT_PDF = 17  # WdSaveFormat.wdFormatPDF
+# HRESULTs meaning the Word process behind _WORD_APP has gone away:
+# RPC_S_SERVER_UNAVAILABLE, RPC_S_CALL_FAILED, RPC_E_DISCONNECTED
+_WORD_GONE_HRESULTS = frozenset((-2147023174, -2147023170, -2147417848))
+
+def _quit_word():
+    global _WORD_APP
+    if _WORD_APP is not None:
+        try:
+            _WORD_APP.Quit()
+        except Exception:
+            pass
+        _WORD_APP = None
+
+def _word_app():
+    """The shared hidden Word instance, started on first use; None if Word cannot be started."""
+    global _WORD_APP, _WORD_APP_FAILED
+    if _WORD_APP is None and not _WORD_APP_FAILED:
+        try:
+            app = win32_client.DispatchEx("Word.Application")
+            app.Visible = False
+            app.DisplayAlerts = 0
+        except Exception as e:
+            # e.g. pywin32 installed but Word is not
+            _WORD_APP_FAILED = True
+            print(f"[ℹ] Word automation unavailable ({e}); using the regular doc2pdf path")
+            return None
+        _WORD_APP = app
+        Finalize(None, _quit_word, exitpriority=10)
+    return _WORD_APP
+
+def _try_fast_docx2pdf(infile, outfile):
+    """
+    Convert through one hidden Word instance kept open across calls (Windows with
+    pywin32), instead of docx2pdf's Word launch per file. Returns False when Word
+    automation is unavailable so the caller falls back to the regular path.
+    """
+    global _WORD_APP
+    if not _load_win32com():
+        return False
+    for attempt in range(2):
+        app = _word_app()
+        if app is None:
+            return False
+        try:
+            doc = app.Documents.Open(os.path.abspath(infile), ReadOnly=True)
+        except Exception as e:
+            if attempt or getattr(e, "hresult", None) not in _WORD_GONE_HRESULTS:
+                raise
+            # Word died since the last document (crash, user closed it): start a new one
+            _WORD_APP = None
+            continue
+        try:
+            doc.SaveAs(os.path.abspath(outfile), FileFormat=_WD_FORMAT_PDF)
+        finally:
+            doc.Close(False)
+        return True
+
+@lru_cache(maxsize=1)
+def _soffice_path():
+    """LibreOffice binary on PATH, looked up once per process."""
+    return shutil.which("soffice")
+
+def docx_to_pdf(infile, outfile, fast=False):
+    """fast: try a persistent Word instance first (--fast-docx; Windows only)."""
+    if fast and _try_fast_docx2pdf(infile, outfile):
+        print(f"[✔] Converted DOCX -> PDF (Word): {outfile}")
+        return
+    if _load_docx2pdf():
         docx2pdf_convert(infile, outfile)
         print(f"[✔] Converted DOCX -> PDF (docx2pdf): {outfile}")
         return
-    soffice = shutil.which("soffice")
+    soffice = _soffice_path()
     if not soffice:
         raise RuntimeError("LibreOffice not found. Install or use docx2pdf.")
-    cmd = [soffice, "--headless", "--convert-to", "pdf", "--outdir",
-           os.path.dirname(outfile) or ".", os.path.abspath(infile)]
-    subprocess.run(cmd, check=True)
-    produced = os.path.join(os.path.dirname(outfile), os.path.splitext(os.path.basename(infile))[0] + ".pdf")
-    if os.path.exists(produced) and produced != outfile:
-        os.replace(produced, outfile)
+    # LibreOffice writes into a private dir next to outfile; the finished PDF is then
+    # renamed into place (same filesystem, so atomic) and never seen half-written
+    outdir = os.path.dirname(outfile) or "."
+    os.makedirs(outdir, exist_ok=True)  # soffice used to create --outdir itself
+    tmpdir = tempfile.mkdtemp(prefix=".lo-", dir=outdir)
+    fresh_profile = None
+    try:
+        produced = os.path.join(tmpdir, os.path.splitext(os.path.basename(infile))[0] + ".pdf")
+        converted = False
+        listener = _soffice_listener(soffice) if _load_uno() else None
+        if listener is not None:
+            try:
+                listener.convert(infile, produced)
+                converted = True
+            except Exception as e:
+                print(f"[ℹ] LibreOffice listener failed ({e}); falling back to soffice --convert-to")
+        if not converted:
+            profile = _lo_profile_dir()
+            if listener is not None and listener.proc.poll() is None:
+                # a second soffice on the listener's profile would hand the job to it and exit
+                profile = fresh_profile = tempfile.mkdtemp(prefix="lo-profile-")
+            cmd = [soffice, "--headless", "-env:UserInstallation=" + pathlib.Path(profile).as_uri(),
+                   "--convert-to", "pdf", "--outdir", tmpdir, os.path.abspath(infile)]
+            subprocess.run(cmd, check=True)
+        try:
+            os.replace(produced, outfile)
+        except FileNotFoundError:
+            raise RuntimeError(f"LibreOffice produced no PDF for {infile}") from None
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        if fresh_profile:
+            shutil.rmtree(fresh_profile, ignore_errors=True)
     print(f"[✔] Converted DOCX -> PDF (LibreOffice): {outfile}")
 
+def docx_to_pdf_stream(docx_bytes, outfile, fast=False):
+    """
+    Convert DOCX content held in memory (e.g. an upload) to outfile. The converters
+    need a path, so the bytes are staged in a temp file on tmpfs (/dev/shm) when
+    available, keeping the round trip out of the disk.
+    """
+    shm = "/dev/shm"
+    tmp_dir = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+    with tempfile.NamedTemporaryFile(suffix=".docx", dir=tmp_dir, delete=False) as tmp:
+        tmp.write(docx_bytes)
+    try:
+        docx_to_pdf(tmp.name, outfile, fast=fast)
+    finally:
+        os.unlink(tmp.name)
+
+def remove_pdf_password(infile, outfile, password):
+    if not password:
+        raise RuntimeError("Please provide password for PDF using --password or -p")
+    if not _load_pikepdf():
+        raise RuntimeError("pikepdf required for removing PDF password: pip install pikepdf")
+    with _open_pdf(infile, password=password) as pdf:
+        # only the encryption goes away: keep object streams and stream data as they are;
+        # saving by path keeps pikepdf's guard against overwriting the open input
+        pdf.save(outfile, linearize=False, object_stream_mode=pikepdf.ObjectStreamMode.preserve,
+                 stream_decode_level=pikepdf.StreamDecodeLevel.none, normalize_content=False)
+    print(f"[✔] Removed PDF password -> {outfile}")
+
+class _MappedFile(mmap.mmap):
+    """Read-only mmap usable where a binary file object is expected (zipfile/olefile)."""
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def writable(self):
+        return False
+
+def remove_office_password(infile, outfile, password):
+    try:
+        import msoffcrypto
+    except Exception:
+        raise RuntimeError("Install msoffcrypto: pip install msoffcrypto-tool")
+    if os.path.exists(outfile) and os.path.samefile(infile, outfile):
+        # opening the output would truncate the (possibly mmap'd) input before it is read
+        raise RuntimeError(f"Output file is the input file: {outfile}")
+    with ExitStack() as stack:
+        f = stack.enter_context(open(infile, "rb", buffering=_INPUT_BUFFER))
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            f = stack.enter_context(_MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ))
+        office = msoffcrypto.OfficeFile(f)
+        if not office.is_encrypted():
+            shutil.copy(infile, outfile)
+            print(f"[ℹ] File not encrypted, copied to {outfile}")
+        else:
+            office.load_key(password=password)
+            # decrypt emits small blocks; coalesce them into large writes
+            with open(outfile, "wb", buffering=_OUTPUT_BUFFER) as out:
+                office.decrypt(out)
+            print(f"[✔] Removed Office password -> {outfile}")
+
+# -----------------------
+# Batch conversions (directory or glob input)
+# -----------------------
+# conversion -> (input extensions picked up from a directory, output extension or None to keep)
+_BATCH_CONVERSIONS = {
+    "pdf2doc": ((".pdf",), ".docx"),
+    "doc2pdf": ((".docx", ".doc"), ".pdf"),
+    "remove_pdf_password": ((".pdf",), None),
+    "remove_office_password": ((".docx", ".xlsx", ".pptx", ".doc", ".xls", ".ppt"), None),
+}
+
+def is_batch_input(infile):
+    """True if infile names a directory or a glob pattern rather than one file."""
+    if os.path.isfile(infile):
+        return False  # an existing file named like "report [v2].pdf" is not a pattern
+    return os.path.isdir(infile) or (glob.has_magic(infile) and not os.path.exists(infile))
+
+def collect_batch_files(infile, exts):
+    if os.path.isdir(infile):
+        with os.scandir(infile) as it:
+            paths = sorted(e.path for e in it if e.name.lower().endswith(exts) and e.is_file())
+    else:
+        paths = sorted(p for p in glob.glob(infile) if os.path.isfile(p))
+    if not paths:
+        raise RuntimeError(f"No files found to convert in {infile}")
+    return paths
+
+def _convert_one(conversion, infile, outfile, password=None, jobs=None, fast_docx=False):
+    """Run one single-file conversion; returns an error message instead of raising so a batch keeps going."""
+    try:
+        if conversion == "pdf2doc":
+            pdf_to_docx(infile, outfile, jobs=jobs)
+        elif conversion == "doc2pdf":
+            docx_to_pdf(infile, outfile, fast=fast_docx)
+        elif conversion == "remove_pdf_password":
+            remove_pdf_password(infile, outfile, password)
+        elif conversion == "remove_office_password":
+            remove_office_password(infile, outfile, password)
+        else:
+            raise RuntimeError(f"Unsupported batch conversion: {conversion}")
+    except Exception as e:
+        return f"{infile}: {e}"
+    finally:
+        _collect_between_conversions()
+    return None
+
+# documents converted in this process since the last full garbage collection
+_CONVERSIONS_SINCE_GC = 0
+_GC_EVERY = 16
+
+def _collect_between_conversions():
+    """
+    pikepdf, pdf2docx and PIL leave large short-lived object graphs behind, some in
+    reference cycles; a full collection every few documents keeps a long batch's
+    memory flat instead of creeping.
+    """
+    global _CONVERSIONS_SINCE_GC
+    _CONVERSIONS_SINCE_GC += 1
+    if _CONVERSIONS_SINCE_GC >= _GC_EVERY:
+        gc.collect()
+        _CONVERSIONS_SINCE_GC = 0
+
+def _batch_convert(paths, conversion, outdir, workers=None, password=None, jobs=None, fast_docx=False):
+    """
+    Convert every path into outdir, spread over `workers` processes (default: one per
+    CPU; 1 runs in-process). Each worker keeps its own LibreOffice profile/instance.
+    jobs is passed to pdf_to_docx; it is 1 whenever documents already run in parallel.
+    Returns the list of error messages for files that failed.
+    """
+    out_ext = _BATCH_CONVERSIONS[conversion][1]
+    os.makedirs(outdir, exist_ok=True)
+    outfiles = []
+    sources = {}  # normalized output path -> input writing it
+    for path in paths:
+        name = os.path.basename(path)
+        if out_ext:
+            name = os.path.splitext(name)[0] + out_ext
+        outfile = os.path.join(outdir, name)
+        if os.path.abspath(outfile) == os.path.abspath(path):
+            raise RuntimeError(f"Output would overwrite input {path}; choose another output directory")
+        key = os.path.normcase(os.path.abspath(outfile))
+        if key in sources:
+            # e.g. a.doc and a.docx both map to a.pdf
+            raise RuntimeError(f"{sources[key]} and {path} would both be written to {outfile}")
+        sources[key] = path
+        outfiles.append(outfile)
+
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers > 1:
+        # pdf2docx's multi-processing keeps its per-page files in the working directory,
+        # so documents parsed at the same time would overwrite each other's
+        if jobs and jobs > 1:
+            print(f"[ℹ] --jobs {jobs} ignored: {workers} documents already convert in parallel")
+        jobs = 1
+    args = (repeat(conversion), paths, outfiles, repeat(password), repeat(jobs), repeat(fast_docx))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            errors = [e for e in executor.map(_convert_one, *args, chunksize=1) if e]
+    else:
+        errors = [e for e in map(_convert_one, *args) if e]
+    for e in errors:
+        print(f"❌ {e}")
+    print(f"[✔] Batch {conversion}: {len(paths) - len(errors)}/{len(paths)} files -> {outdir}")
+    return errors
+
 # -----------------------
 # CLI
 # -----------------------
+# conversion names accepted for the image and PDF-merge commands
+IMG2PDF_ALIASES = frozenset(("image2pdf", "image_to_pdf", "img2pdf",
+                             "images2pdf", "images_to_pdf", "imgmergepdf", "image_merge_pdf"))
+PDFMERGE_ALIASES = frozenset(("pdfmerge", "mergepdf", "pdf_merge"))
+
 def build_parser():
     p = argparse.ArgumentParser(prog="document_converter.py",
                                 description="Convert/merge documents and images to PDF and vice-versa.")
-    p.add_argument("infile", help="Input file(s). For multiple, use comma-separated list or a directory for images.")
+    p.add_argument("infile", help="Input file(s). For multiple, use comma-separated list or a directory for images; "
+                   "a directory or glob batch-converts pdf2doc/doc2pdf/remove_*_password into <outfile> as a directory.")
     p.add_argument("outfile", help="Output file path.")
     p.add_argument("conversion", help="Conversion type: image2pdf | images2pdf | pdfmerge | pdf2doc | doc2pdf | remove_pdf_password | remove_office_password",
                    type=str)
@@ -664,8 +1436,71 @@ def build_parser():
     p.add_argument("--progress", action="store_true", help="Show progress output for large image sets (uses tqdm if available).")
     p.add_argument("--sort", action="store_true", help="Sort directory image listing alphabetically before merging.")
     p.add_argument("--password", "-p", default=None, help="Password for password-removal commands.")
+    p.add_argument("--workers", "-w", default=None, type=int,
+                   help="Worker processes for batch conversions and non-streaming image rendering. Default: one per CPU.")
+    p.add_argument("--fast-docx", action="store_true",
+                   help="doc2pdf: convert through one persistent hidden Word instance (Windows with pywin32).")
+    p.add_argument("--jobs", "-j", default=None, type=int,
+                   help="Processes per document for pdf2doc page parsing. Default: CPUs - 1 (always 1 in parallel batches).")
     return p
 
+# command handlers: each takes the parsed CLI args
+def _do_img2pdf(args):
+    per_page_sizes = parse_mapping(args.per_page_sizes, parse_page_size) if args.per_page_sizes else {}
+    per_image_margins = parse_mapping(args.per_image_margins, parse_margin_value) if args.per_image_margins else {}
+    per_image_rotation = parse_mapping(args.per_image_rotation, parse_rotation_value) if args.per_image_rotation else {}
+    img_opts = dict(default_page_size_mm=args.page_size or PAGE_SIZES_MM["A4"], dpi=args.dpi,
+                    default_margin_mm=args.margin_mm, scaling=args.scaling, show_progress=args.progress,
+                    sort=args.sort, align_h=args.align_h, align_v=args.align_v,
+                    per_page_sizes=per_page_sizes, per_image_margins=per_image_margins,
+                    per_image_rotation=per_image_rotation, autorotate=args.autorotate,
+                    auto_orient=args.auto_orient)
+    # single image or many: both writers accept a path, a comma list or a directory
+    if args.streaming:
+        streaming_images_to_pdf(args.infile, args.outfile, **img_opts)
+    else:
+        images_to_pdf_non_streaming(args.infile, args.outfile, workers=args.workers, **img_opts)
+
+def _do_pdfmerge(args):
+    pdf_merge(args.infile, args.outfile)
+
+def _do_pdf2doc(args):
+    pdf_to_docx(args.infile, args.outfile, jobs=args.jobs)
+
+def _do_doc2pdf(args):
+    docx_to_pdf(args.infile, args.outfile, fast=args.fast_docx)
+
+def _do_remove_pdf_password(args):
+    remove_pdf_password(args.infile, args.outfile, args.password)
+
+def _do_remove_office_password(args):
+    remove_office_password(args.infile, args.outfile, args.password)
+
+def _do_batch(args):
+    # directory / glob input: outfile is the output directory
+    paths = collect_batch_files(args.infile, _BATCH_CONVERSIONS[args.conversion][0])
+    errors = _batch_convert(paths, args.conversion, args.outfile, workers=args.workers,
+                            password=args.password, jobs=args.jobs, fast_docx=args.fast_docx)
+    if errors:
+        raise RuntimeError(f"{len(errors)} of {len(paths)} conversions failed")
+
+_DISPATCH = {
+    **dict.fromkeys(IMG2PDF_ALIASES, _do_img2pdf),
+    **dict.fromkeys(PDFMERGE_ALIASES, _do_pdfmerge),
+    "pdf2doc": _do_pdf2doc,
+    "doc2pdf": _do_doc2pdf,
+    "remove_pdf_password": _do_remove_pdf_password,
+    "remove_office_password": _do_remove_office_password,
+}
+
+def _print_usage_and_exit():
+    print("❌ Unknown conversion type. Use one of:")
+    print("   pdf2doc | doc2pdf | remove_pdf_password | remove_office_password")
+    print("   image2pdf | images2pdf | pdfmerge")
+    print("\nFor detailed usage, run:")
+    print("   python document_converter.py --help")
+    sys.exit(1)
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -673,103 +1508,16 @@ def main():
 
     parser = build_parser()
     args = parser.parse_args()
+    args.conversion = args.conversion.lower()
 
-    infile = args.infile
-    outfile = args.outfile
-    conversion = args.conversion.lower()
-    page_size = args.page_size or PAGE_SIZES_MM["A4"]
-    dpi = args.dpi
-    margin = args.margin_mm
-    scaling = args.scaling
-    align_h = args.align_h
-    align_v = args.align_v
-    show_progress = args.progress
-    sort = args.sort
-    password = args.password
-    streaming = args.streaming
-    autorotate = args.autorotate
-    auto_orient = args.auto_orient
-
-    per_page_sizes = {}
-    per_image_margins = {}
-    per_image_rotation = {}
-    if args.per_page_sizes:
-        per_page_sizes = parse_mapping(args.per_page_sizes, parse_page_size)
-    if args.per_image_margins:
-        per_image_margins = parse_mapping(args.per_image_margins, parse_margin_value)
-    if args.per_image_rotation:
-        per_image_rotation = parse_mapping(args.per_image_rotation, parse_rotation_value)
+    handler = _DISPATCH.get(args.conversion)
+    if handler is None:
+        _print_usage_and_exit()
+    if args.conversion in _BATCH_CONVERSIONS and is_batch_input(args.infile):
+        handler = _do_batch
 
     try:
-        if conversion in ("image2pdf", "image_to_pdf", "img2pdf"):
-            # single image
-            if streaming:
-                streaming_images_to_pdf(infile, outfile, default_page_size_mm=page_size, dpi=dpi,
-                                        default_margin_mm=margin, scaling=scaling, show_progress=show_progress,
-                                        sort=sort, align_h=align_h, align_v=align_v,
-                                        per_page_sizes=per_page_sizes, per_image_margins=per_image_margins,
-                                        per_image_rotation=per_image_rotation, autorotate=autorotate,
-                                        auto_orient=auto_orient)
-            else:
-                images_to_pdf_non_streaming(infile, outfile, default_page_size_mm=page_size, dpi=dpi,
-                                            default_margin_mm=margin, scaling=scaling, show_progress=show_progress,
-                                            sort=sort, align_h=align_h, align_v=align_v,
-                                            per_page_sizes=per_page_sizes, per_image_margins=per_image_margins,
-                                            per_image_rotation=per_image_rotation, autorotate=autorotate,
-                                            auto_orient=auto_orient)
-        elif conversion in ("images2pdf", "images_to_pdf", "imgmergepdf", "image_merge_pdf"):
-            if streaming:
-                streaming_images_to_pdf(infile, outfile, default_page_size_mm=page_size, dpi=dpi,
-                                        default_margin_mm=margin, scaling=scaling, show_progress=show_progress,
-                                        sort=sort, align_h=align_h, align_v=align_v,
-                                        per_page_sizes=per_page_sizes, per_image_margins=per_image_margins,
-                                        per_image_rotation=per_image_rotation, autorotate=autorotate,
-                                        auto_orient=auto_orient)
-            else:
-                images_to_pdf_non_streaming(infile, outfile, default_page_size_mm=page_size, dpi=dpi,
-                                            default_margin_mm=margin, scaling=scaling, show_progress=show_progress,
-                                            sort=sort, align_h=align_h, align_v=align_v,
-                                            per_page_sizes=per_page_sizes, per_image_margins=per_image_margins,
-                                            per_image_rotation=per_image_rotation, autorotate=autorotate,
-                                            auto_orient=auto_orient)
-        elif conversion in ("pdfmerge", "mergepdf", "pdf_merge"):
-            pdf_merge(infile, outfile)
-        else:
-            # other legacy conversions
-            if conversion == "pdf2doc":
-                pdf_to_docx(infile, outfile)
-            elif conversion == "doc2pdf":
-                docx_to_pdf(infile, outfile)
-            elif conversion == "remove_pdf_password":
-                if not password:
-                    raise RuntimeError("Please provide password for PDF using --password or -p")
-                if not pikepdf:
-                    raise RuntimeError("pikepdf required for removing PDF password: pip install pikepdf")
-                with pikepdf.open(infile, password=password) as pdf:
-                    pdf.save(outfile)
-                print(f"[✔] Removed PDF password -> {outfile}")
-            elif conversion == "remove_office_password":
-                try:
-                    import msoffcrypto
-                except Exception:
-                    raise RuntimeError("Install msoffcrypto: pip install msoffcrypto-tool")
-                with open(infile, "rb") as f:
-                    office = msoffcrypto.OfficeFile(f)
-                    if not office.is_encrypted():
-                        shutil.copy(infile, outfile)
-                        print(f"[ℹ] File not encrypted, copied to {outfile}")
-                    else:
-                        office.load_key(password=password)
-                        with open(outfile, "wb") as out:
-                            office.decrypt(out)
-                        print(f"[✔] Removed Office password -> {outfile}")
-            else:
-                print("❌ Unknown conversion type. Use one of:")
-                print("   pdf2doc | doc2pdf | remove_pdf_password | remove_office_password")
-                print("   image2pdf | images2pdf | pdfmerge")
-                print("\nFor detailed usage, run:")
-                print("   python document_converter.py --help")
-                sys.exit(1)
+        handler(args)
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)